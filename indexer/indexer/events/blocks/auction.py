@@ -1,11 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 from indexer.events.blocks.utils import AccountId, Amount
 from indexer.events import context
 from indexer.events.blocks.basic_matchers import BlockMatcher
 from indexer.events.blocks.basic_blocks import Block, TonTransferBlock
 
 
+@dataclass
+class AuctionBidData:
+    amount: Amount
+    bidder: AccountId
+    auction: AccountId
+    nft_address: AccountId
+    nft_item_index: int | None
+    nft_collection: AccountId | None
+
+
 class AuctionBid(Block):
-    def __init__(self, data):
+    data: AuctionBidData
+
+    def __init__(self, data: AuctionBidData | None):
         super().__init__('auction_bid', [], data)
 
     def __repr__(self):
@@ -32,33 +48,33 @@ class AuctionBidMatcher(BlockMatcher):
         if interfaces is None:
             return []
 
-        bid_block = AuctionBid({})
+        bid_block = AuctionBid(None)
 
         if 'NftAuction' in interfaces:
             nft_address = interfaces['NftAuction']['nft_addr']
             nft_item = await context.interface_repository.get().get_nft_item(nft_address)
-            data = {
-                'amount': Amount(block.event_nodes[0].message.value),
-                'bidder': AccountId(block.event_nodes[0].message.source),
-                'auction': AccountId(block.event_nodes[0].message.destination),
-                'nft_address': AccountId(nft_address),
-                'nft_item_index': None,
-                'nft_collection': None
-            }
+            data = AuctionBidData(
+                amount=Amount(block.event_nodes[0].message.value),
+                bidder=AccountId(block.event_nodes[0].message.source),
+                auction=AccountId(block.event_nodes[0].message.destination),
+                nft_address=AccountId(nft_address),
+                nft_item_index=None,
+                nft_collection=None
+            )
             if nft_item:
-                data['nft_item_index'] = nft_item.index
-                data['nft_collection'] = AccountId(nft_item.collection_address)
+                data.nft_item_index = nft_item.index
+                data.nft_collection = AccountId(nft_item.collection_address)
             bid_block.data = data
         elif 'NftItem' in interfaces and _is_teleitem(interfaces['NftItem']):
             nft_data = interfaces['NftItem']
-            bid_block.data = {
-                'amount': Amount(block.event_nodes[0].message.value),
-                'bidder': AccountId(block.event_nodes[0].message.source),
-                'auction': AccountId(block.event_nodes[0].message.destination),
-                'nft_address': AccountId(block.event_nodes[0].message.destination),
-                'nft_collection': AccountId(nft_data['collection_address']) if nft_data['collection_address'] is not None else None,
-                'nft_item_index': nft_data['index'] if nft_data['index'] is not None else None
-            }
+            bid_block.data = AuctionBidData(
+                amount=Amount(block.event_nodes[0].message.value),
+                bidder=AccountId(block.event_nodes[0].message.source),
+                auction=AccountId(block.event_nodes[0].message.destination),
+                nft_address=AccountId(block.event_nodes[0].message.destination),
+                nft_collection=AccountId(nft_data['collection_address']) if nft_data['collection_address'] is not None else None,
+                nft_item_index=nft_data['index'] if nft_data['index'] is not None else None
+            )
         else:
             return []
         bid_block.merge_blocks([block])
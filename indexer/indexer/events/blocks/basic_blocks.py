@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+from dataclasses import dataclass
 
 from pytoniq_core import Slice
 
@@ -25,7 +26,18 @@ def _fill_flow_from_node(flow: AccountValueFlow, node: EventNode):
             flow.add_fees(AccountId(msg.source), msg.fwd_fee)
 
 
+@dataclass
+class TonTransferData:
+    source: AccountId | None
+    destination: AccountId | None
+    value: Amount
+    comment: str | None
+    encrypted: bool
+    extra_currencies: dict | None
+
+
 class TonTransferBlock(Block):
+    data: TonTransferData
     value: int
     comment: str | None
     encrypted: bool
@@ -39,19 +51,19 @@ class TonTransferBlock(Block):
                 self.comment_encoded = True
                 self.comment = str(base64.b64encode(msg.comment), encoding='utf-8')
             else:
-                self.comment = msg.comment.decode('utf-8', errors='backslashreplace').replace("\u0000", "")
+                self.comment = msg.comment.translate(None, b'\x00').decode('utf-8', errors='backslashreplace')
         else:
             self.comment = None
 
-        super().__init__('ton_transfer', [node], {
-            'extra_currencies': node.message.value_extra_currencies,
-            'source': AccountId(node.message.source) if node.message.source is not None else None,
-            'destination': AccountId(
+        super().__init__('ton_transfer', [node], TonTransferData(
+            source=AccountId(node.message.source) if node.message.source is not None else None,
+            destination=AccountId(
                 node.message.destination) if node.message.destination is not None else None,
-            'value': Amount(node.message.value),
-            'comment': self.comment,
-            'encrypted': self.encrypted,
-        })
+            value=Amount(node.message.value),
+            comment=self.comment,
+            encrypted=self.encrypted,
+            extra_currencies=node.message.value_extra_currencies,
+        ))
         if node.failed:
             if node.message is not None and node.message.bounce == True:
                 self.failed = True
@@ -66,18 +78,28 @@ class TonTransferBlock(Block):
         if tx is not None and tx.end_status == 'active' and tx.orig_status not in ('active', 'frozen'):
             self.children_blocks.append(ContractDeploy(node))
 
+@dataclass
+class CallContractData:
+    opcode: int
+    source: AccountId | None
+    destination: AccountId | None
+    value: Amount
+    extra_currencies: dict | None = None
+
+
 class CallContractBlock(Block):
+    data: CallContractData
     opcode: int
 
     def __init__(self, node: EventNode):
-        super().__init__('call_contract', [node], {
-            'extra_currencies': node.message.value_extra_currencies,
-            'opcode': node.get_opcode(),
-            'source': AccountId(node.message.source) if node.message.source is not None else None,
-            'destination': AccountId(
+        super().__init__('call_contract', [node], CallContractData(
+            opcode=node.get_opcode(),
+            source=AccountId(node.message.source) if node.message.source is not None else None,
+            destination=AccountId(
                 node.message.destination) if node.message.destination is not None else None,
-            'value': Amount(node.message.value),
-        })
+            value=Amount(node.message.value),
+            extra_currencies=node.message.value_extra_currencies,
+        ))
         self.failed = node.failed
         self.is_external = node.message.source is None
         self.opcode = node.get_opcode()
@@ -98,22 +120,29 @@ class CallContractBlock(Block):
         return f"!{self.btype}:={hex(self.opcode)}"
 
 class ContractDeploy(Block):
+    data: CallContractData
+
     def __init__(self, node: EventNode):
-        super().__init__('contract_deploy', [node], {
-            'opcode': node.get_opcode(),
-            'source': AccountId(node.message.source) if node.message.source is not None else None,
-            'destination': AccountId(
+        super().__init__('contract_deploy', [node], CallContractData(
+            opcode=node.get_opcode(),
+            source=AccountId(node.message.source) if node.message.source is not None else None,
+            destination=AccountId(
                 node.message.destination) if node.message.destination is not None else None,
-            'value': Amount(node.message.value),
-        })
+            value=Amount(node.message.value),
+        ))
         self.failed = node.failed
         self.is_external = node.message.source is None
         self.opcode = node.get_opcode()
 
+@dataclass
+class TickTockData:
+    account: AccountId
+
+
 class TickTockBlock(Block):
+    data: TickTockData
+
     def __init__(self, node: EventNode):
-        super().__init__('tick_tock', [node], {
-            'account': AccountId(node.get_tx().account)
-        })
+        super().__init__('tick_tock', [node], TickTockData(account=AccountId(node.get_tx().account)))
         self.failed = node.failed
         self.is_external = node.message.source is None
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pytoniq_core import Slice
 
 from indexer.events.blocks.messages.dns import ChangeDnsRecordMessage
@@ -11,22 +13,52 @@ from indexer.events import context
 
 zero_key = b'\x00' * 32
 
+@dataclass
+class DeleteDnsRecordData:
+    source: AccountId | None
+    destination: AccountId
+    key: bytes
+    collection_address: AccountId | None = None
+
+
 class DeleteDnsRecordBlock(Block):
-    def __init__(self, data):
+    data: DeleteDnsRecordData
+
+    def __init__(self, data: DeleteDnsRecordData):
         super().__init__('delete_dns', [], data)
 
     def __repr__(self):
         return f"DELETE_DNS {self.event_nodes[0].message.transaction.hash}"
 
+@dataclass
+class DnsRenewData:
+    source: AccountId | None
+    destination: AccountId
+    collection_address: AccountId | None = None
+
+
 class DnsRenewBlock(Block):
-    def __init__(self, data):
+    data: DnsRenewData
+
+    def __init__(self, data: DnsRenewData):
         super().__init__('renew_dns', [], data)
 
     def __repr__(self):
         return f"DNS_RENEW {self.event_nodes[0].message.transaction.hash}"
 
+@dataclass
+class ChangeDnsRecordData:
+    source: AccountId | None
+    destination: AccountId
+    key: bytes
+    value: dict
+    collection_address: AccountId | None = None
+
+
 class ChangeDnsRecordBlock(Block):
-    def __init__(self, data):
+    data: ChangeDnsRecordData
+
+    def __init__(self, data: ChangeDnsRecordData):
         super().__init__('change_dns', [], data)
 
     def __repr__(self):
@@ -49,26 +81,26 @@ class ChangeDnsRecordMatcher(BlockMatcher):
         nft_item = await context.interface_repository.get().get_nft_item(block.event_nodes[0].message.destination)
 
         if change_dns_message.has_value:
-            new_block = ChangeDnsRecordBlock({
-                'source': AccountId(sender) if sender is not None else None,
-                'destination': AccountId(block.event_nodes[0].message.destination),
-                'key': change_dns_message.key,
-                'value': change_dns_message.value,
-            })
+            new_block = ChangeDnsRecordBlock(ChangeDnsRecordData(
+                source=AccountId(sender) if sender is not None else None,
+                destination=AccountId(block.event_nodes[0].message.destination),
+                key=change_dns_message.key,
+                value=change_dns_message.value,
+            ))
         else:
             if change_dns_message.key == zero_key:
-                new_block = DnsRenewBlock({
-                    'source': AccountId(sender) if sender is not None else None,
-                    'destination': AccountId(block.event_nodes[0].message.destination),
-                })
+                new_block = DnsRenewBlock(DnsRenewData(
+                    source=AccountId(sender) if sender is not None else None,
+                    destination=AccountId(block.event_nodes[0].message.destination),
+                ))
             else:
-                new_block = DeleteDnsRecordBlock({
-                    'source': AccountId(sender) if sender is not None else None,
-                    'destination': AccountId(block.event_nodes[0].message.destination),
-                    'key': change_dns_message.key,
-                })
+                new_block = DeleteDnsRecordBlock(DeleteDnsRecordData(
+                    source=AccountId(sender) if sender is not None else None,
+                    destination=AccountId(block.event_nodes[0].message.destination),
+                    key=change_dns_message.key,
+                ))
         if nft_item is not None:
-            new_block.data['collection_address'] = AccountId(nft_item.collection_address)
+            new_block.data.collection_address = AccountId(nft_item.collection_address)
         new_block.failed = block.failed
         new_block.merge_blocks([block] + other_blocks)
         return [new_block]
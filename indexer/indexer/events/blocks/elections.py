@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 from indexer.events.blocks.basic_blocks import CallContractBlock
 from indexer.events.blocks.basic_matchers import BlockMatcher, ContractMatcher
 from indexer.events.blocks.core import Block
@@ -9,8 +13,16 @@ from indexer.events.blocks.utils.block_utils import get_labeled
 
 elector_address = '-1:3333333333333333333333333333333333333333333333333333333333333333'
 
+@dataclass
+class ElectionStakeData:
+    stake_holder: AccountId
+    amount: Amount | None = None
+
+
 class ElectionDepositStakeBlock(Block):
-    def __init__(self, data):
+    data: ElectionStakeData
+
+    def __init__(self, data: ElectionStakeData):
         super().__init__('election_deposit', [], data)
 
     def __repr__(self):
@@ -18,7 +30,9 @@ class ElectionDepositStakeBlock(Block):
 
 
 class ElectionRecoverStakeBlock(Block):
-    def __init__(self, data):
+    data: ElectionStakeData
+
+    def __init__(self, data: ElectionStakeData):
         super().__init__('election_recover', [], data)
 
     def __repr__(self):
@@ -36,10 +50,10 @@ class ElectionDepositStakeBlockMatcher(BlockMatcher):
                 and block.get_message().destination == elector_address)
 
     async def build_block(self, block: Block, other_blocks: list[Block]) -> list[Block]:
-        data = {
-            'amount': Amount(block.event_nodes[0].message.value),
-            'stake_holder': AccountId(block.event_nodes[0].message.source),
-        }
+        data = ElectionStakeData(
+            stake_holder=AccountId(block.event_nodes[0].message.source),
+            amount=Amount(block.event_nodes[0].message.value),
+        )
         confirmation = get_labeled('confirmation', other_blocks, CallContractBlock)
         new_block = ElectionDepositStakeBlock(data)
         new_block.failed = confirmation is None
@@ -60,13 +74,13 @@ class ElectionRecoverStakeBlockMatcher(BlockMatcher):
                 and block.get_message().destination == elector_address)
 
     async def build_block(self, block: Block, other_blocks: list[Block]) -> list[Block]:
-        data = {
-            'stake_holder': AccountId(block.event_nodes[0].message.source)
-        }
+        data = ElectionStakeData(
+            stake_holder=AccountId(block.event_nodes[0].message.source)
+        )
         response = get_labeled('confirmation', other_blocks, CallContractBlock)
         failed = False
         if response is not None:
-            data['amount'] = Amount(response.event_nodes[0].message.value)
+            data.amount = Amount(response.event_nodes[0].message.value)
         else:
             failed = True
         new_block = ElectionRecoverStakeBlock(data)
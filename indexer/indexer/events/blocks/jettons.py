@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+from dataclasses import dataclass
 
 from indexer.events import context
 from indexer.events.blocks.basic_blocks import CallContractBlock
@@ -13,8 +14,32 @@ from indexer.events.blocks.utils import AccountId, Asset, Amount
 from indexer.events.blocks.utils.block_utils import find_call_contract
 
 
+@dataclass
+class JettonTransferData:
+    has_internal_transfer: bool
+    sender: AccountId
+    sender_wallet: AccountId | None
+    receiver: AccountId
+    receiver_wallet: AccountId | None
+    response_address: AccountId
+    forward_amount: Amount
+    query_id: int
+    asset: Asset
+    amount: Amount
+    forward_payload: str | None
+    custom_payload: str | None
+    comment: bytes | None
+    encrypted_comment: bool
+    payload_opcode: str | None
+    stonfi_swap_body: dict | None
+    desired_forward_amount: Amount | None = None
+    desired_amount: Amount | None = None
+
+
 class JettonTransferBlock(Block):
-    def __init__(self, data, jetton_transfer_message: JettonTransfer):
+    data: JettonTransferData
+
+    def __init__(self, data: JettonTransferData | None, jetton_transfer_message: JettonTransfer):
         super().__init__('jetton_transfer', [], data)
         self.jetton_transfer_message = jetton_transfer_message
 
@@ -22,17 +47,38 @@ class JettonTransferBlock(Block):
         return f"JETTON TRANSFER {self.event_nodes[0].message.transaction.hash}"
 
 
+@dataclass
+class JettonBurnData:
+    owner: AccountId | None
+    jetton_wallet: AccountId
+    amount: Amount
+    asset: Asset
+
+
 class JettonBurnBlock(Block):
+    data: JettonBurnData
+
     def __init__(self):
-        super().__init__('jetton_burn', [], {})
+        super().__init__('jetton_burn', [], None)
 
     def __repr__(self):
         return f"JETTON BURN {self.data}"
 
 
+@dataclass
+class JettonMintData:
+    to: AccountId
+    to_jetton_wallet: AccountId | None
+    amount: Amount | None
+    ton_amount: Amount
+    asset: Asset
+
+
 class JettonMintBlock(Block):
+    data: JettonMintData
+
     def __init__(self):
-        super().__init__("jetton_mint", [], {})
+        super().__init__("jetton_mint", [], None)
 
     def __repr__(self):
         return f"JETTON MINT {self.data}"
@@ -50,7 +96,7 @@ class JettonTransferBlockMatcher(BlockMatcher):
         include = [block]
         include.extend(other_blocks)
         jetton_transfer_message = JettonTransfer(block.get_body())
-        new_block = JettonTransferBlock({}, jetton_transfer_message)
+        new_block = JettonTransferBlock(None, jetton_transfer_message)
 
         internal_transfer = find_call_contract(other_blocks, JettonInternalTransfer.opcode)
         has_internal_transfer = internal_transfer is not None
@@ -78,28 +124,28 @@ class JettonTransferBlockMatcher(BlockMatcher):
 
         asset = Asset(is_ton=False, jetton_address=receiver_wallet_info.jetton)
 
-        data = {
-            'has_internal_transfer': has_internal_transfer,
-            'sender': AccountId(sender),
-            'sender_wallet': AccountId(sender_jetton_wallet),
-            'receiver': AccountId(receiver),
-            'receiver_wallet': AccountId(receiver_wallet),
-            'response_address': AccountId(jetton_transfer_message.response),
-            'forward_amount': Amount(forward_ton_amount),
-            'desired_forward_amount': Amount(jetton_transfer_message.forward_amount),
-            'query_id': jetton_transfer_message.query_id,
-            'asset': asset,
-            'amount': Amount(amount),
-            'desired_amount': Amount(jetton_transfer_message.amount),
-            'forward_payload': base64.b64encode(jetton_transfer_message.forward_payload).decode(
+        data = JettonTransferData(
+            has_internal_transfer=has_internal_transfer,
+            sender=AccountId(sender),
+            sender_wallet=AccountId(sender_jetton_wallet),
+            receiver=AccountId(receiver),
+            receiver_wallet=AccountId(receiver_wallet),
+            response_address=AccountId(jetton_transfer_message.response),
+            forward_amount=Amount(forward_ton_amount),
+            desired_forward_amount=Amount(jetton_transfer_message.forward_amount),
+            query_id=jetton_transfer_message.query_id,
+            asset=asset,
+            amount=Amount(amount),
+            desired_amount=Amount(jetton_transfer_message.amount),
+            forward_payload=base64.b64encode(jetton_transfer_message.forward_payload).decode(
                 'utf-8') if jetton_transfer_message.forward_payload is not None else None,
-            'custom_payload': base64.b64encode(jetton_transfer_message.custom_payload).decode(
+            custom_payload=base64.b64encode(jetton_transfer_message.custom_payload).decode(
                 'utf-8') if jetton_transfer_message.custom_payload is not None else None,
-            'comment': jetton_transfer_message.comment,
-            'encrypted_comment': jetton_transfer_message.encrypted_comment,
-            'payload_opcode': jetton_transfer_message.payload_sum_type,
-            'stonfi_swap_body': jetton_transfer_message.stonfi_swap_body
-        }
+            comment=jetton_transfer_message.comment,
+            encrypted_comment=jetton_transfer_message.encrypted_comment,
+            payload_opcode=jetton_transfer_message.payload_sum_type,
+            stonfi_swap_body=jetton_transfer_message.stonfi_swap_body
+        )
 
         new_block.data = data
         new_block.merge_blocks(include)
@@ -125,7 +171,7 @@ class PTonTransferMatcher(BlockMatcher):
         include.extend(other_blocks)
 
         jetton_transfer_message = JettonTransfer(block.get_body())
-        new_block = JettonTransferBlock({}, jetton_transfer_message)
+        new_block = JettonTransferBlock(None, jetton_transfer_message)
 
         wallet = block.get_message().destination
         wallet_info = await context.interface_repository.get().get_jetton_wallet(wallet)
@@ -136,49 +182,48 @@ class PTonTransferMatcher(BlockMatcher):
 
         asset = Asset(is_ton=False, jetton_address=wallet_info.jetton)
 
-        data = {
-            'has_internal_transfer': False,
-            'sender': AccountId(sender),
-            'sender_wallet': None,
-            'receiver': AccountId(receiver),
-            'receiver_wallet': None,
-            'response_address': AccountId(jetton_transfer_message.response),
-            'forward_amount': Amount(jetton_transfer_message.forward_amount),
-            'query_id': jetton_transfer_message.query_id,
-            'asset': asset,
-            'amount': Amount(jetton_transfer_message.amount),
-            'forward_payload': base64.b64encode(jetton_transfer_message.forward_payload).decode(
+        data = JettonTransferData(
+            has_internal_transfer=False,
+            sender=AccountId(sender),
+            sender_wallet=None,
+            receiver=AccountId(receiver),
+            receiver_wallet=None,
+            response_address=AccountId(jetton_transfer_message.response),
+            forward_amount=Amount(jetton_transfer_message.forward_amount),
+            query_id=jetton_transfer_message.query_id,
+            asset=asset,
+            amount=Amount(jetton_transfer_message.amount),
+            forward_payload=base64.b64encode(jetton_transfer_message.forward_payload).decode(
                 'utf-8') if jetton_transfer_message.forward_payload is not None else None,
-            'custom_payload': base64.b64encode(jetton_transfer_message.custom_payload).decode(
+            custom_payload=base64.b64encode(jetton_transfer_message.custom_payload).decode(
                 'utf-8') if jetton_transfer_message.custom_payload is not None else None,
-            'comment': jetton_transfer_message.comment,
-            'encrypted_comment': jetton_transfer_message.encrypted_comment,
-            'payload_opcode': jetton_transfer_message.payload_sum_type,
-            'stonfi_swap_body': jetton_transfer_message.stonfi_swap_body
-        }
+            comment=jetton_transfer_message.comment,
+            encrypted_comment=jetton_transfer_message.encrypted_comment,
+            payload_opcode=jetton_transfer_message.payload_sum_type,
+            stonfi_swap_body=jetton_transfer_message.stonfi_swap_body
+        )
 
         new_block.data = data
         new_block.merge_blocks(include)
         new_block.failed = block.failed
         return [new_block]
 
-async def _get_jetton_burn_data(new_block: Block, block: Block | CallContractBlock) -> dict:
+async def _get_jetton_burn_data(new_block: Block, block: Block | CallContractBlock) -> JettonBurnData:
     jetton_burn_message = JettonBurn(block.get_body())
     wallet = await context.interface_repository.get().get_jetton_wallet(block.get_message().destination)
     assert wallet is not None
     new_block.value_flow.add_jetton(AccountId(wallet.owner), AccountId(wallet.jetton), -jetton_burn_message.amount)
-    data = {
-        'owner': AccountId(wallet.owner) if wallet is not None else None,
-        'jetton_wallet': AccountId(block.get_message().destination),
-        'amount': Amount(jetton_burn_message.amount),
-        'asset': Asset(is_ton=False, jetton_address=wallet.jetton if wallet is not None else None)
-    }
-    return data
+    return JettonBurnData(
+        owner=AccountId(wallet.owner) if wallet is not None else None,
+        jetton_wallet=AccountId(block.get_message().destination),
+        amount=Amount(jetton_burn_message.amount),
+        asset=Asset(is_ton=False, jetton_address=wallet.jetton if wallet is not None else None)
+    )
 
 async def _get_jetton_mint_data(
     new_block: Block, block: Block | CallContractBlock,
     blocks: list[Block]
-) -> tuple[dict, bool]:
+) -> tuple[JettonMintData, bool]:
     if block.opcode == MinterJettonMint.opcode:
         jetton_mint_info = MinterJettonMint(block.get_body())
     else:
@@ -204,27 +249,27 @@ async def _get_jetton_mint_data(
             internal_transfer_info.amount,
         )
 
-        data = {
-            "to": AccountId(receiver_jwallet.owner),
-            "to_jetton_wallet": AccountId(receiver_jwallet.address),
-            "amount": Amount(internal_transfer_info.amount),
-            "ton_amount": Amount(jetton_mint_info.ton_amount),
-            "asset": Asset(
+        data = JettonMintData(
+            to=AccountId(receiver_jwallet.owner),
+            to_jetton_wallet=AccountId(receiver_jwallet.address),
+            amount=Amount(internal_transfer_info.amount),
+            ton_amount=Amount(jetton_mint_info.ton_amount),
+            asset=Asset(
                 is_ton=False,
                 jetton_address=(receiver_jwallet.jetton),
             ),
-        }
+        )
         return data, failed
     else:
-        data = {
-            "to": AccountId(jetton_mint_info.to_address),
-            "to_jetton_wallet": None,
-            "asset": Asset(is_ton=False, jetton_address=block.get_message().destination),
-            "amount": None,
-            "ton_amount": Amount(jetton_mint_info.ton_amount),
-        }
+        data = JettonMintData(
+            to=AccountId(jetton_mint_info.to_address),
+            to_jetton_wallet=None,
+            asset=Asset(is_ton=False, jetton_address=block.get_message().destination),
+            amount=None,
+            ton_amount=Amount(jetton_mint_info.ton_amount),
+        )
         if block.opcode == MinterJettonMint.opcode:
-            data['amount'] = Amount(jetton_mint_info.master_msg_jetton_amount)
+            data.amount = Amount(jetton_mint_info.master_msg_jetton_amount)
     return data, True
 
 class JettonBurnBlockMatcher(BlockMatcher):
@@ -443,11 +443,11 @@ class DedustWithdrawBlockMatcher(BlockMatcher):
                 user_wallets.append(None)
                 dex_vaults.append(AccountId(call_from_vault.get_message().source))
             elif isinstance(call_from_vault, JettonTransferBlock):
-                dex_wallet = call_from_vault.data['sender_wallet']
+                dex_wallet = call_from_vault.data.sender_wallet
                 dex_wallets.append(dex_wallet)
-                asset = call_from_vault.data['asset']
-                user_wallets.append(call_from_vault.data['receiver_wallet'])
-                dex_vaults.append(call_from_vault.data['sender'])
+                asset = call_from_vault.data.asset
+                user_wallets.append(call_from_vault.data.receiver_wallet)
+                dex_vaults.append(call_from_vault.data.sender)
 
             else:
                 # unexpected opcode
@@ -543,7 +543,7 @@ class StonfiV2ProvideLiquidityMatcher(BlockMatcher):
 
         asset = None
         if isinstance(in_transfer, JettonTransferBlock):
-            asset = in_transfer.data['asset']
+            asset = in_transfer.data.asset
         else:
             asset = Asset(is_ton=True, jetton_address=None)
         provide_liquidity_msg = StonfiV2ProvideLiquidity(block.get_body())
@@ -553,7 +553,7 @@ class StonfiV2ProvideLiquidityMatcher(BlockMatcher):
             'amount_1': Amount(amount),
             'asset_1': asset,
             'sender': AccountId(provide_liquidity_msg.from_user),
-            'sender_wallet_1': (in_transfer.data['sender_wallet']
+            'sender_wallet_1': (in_transfer.data.sender_wallet
                               if isinstance(in_transfer, JettonTransferBlock) else None),
             'amount_2': None,
             'asset_2': None,
@@ -629,19 +629,19 @@ class StonfiV2WithdrawLiquidityMatcher(BlockMatcher):
                     amount = Amount(PTonTransfer(pton_transfer.get_body()).ton_amount)
                     additional_blocks.append(pton_transfer)
                 else:
-                    amount = transfer.data['amount']
+                    amount = transfer.data.amount
                 if amount1 is None:
                     amount1 = amount
-                    asset1 = transfer.data['asset']
-                    wallet1 = transfer.data['receiver_wallet']
-                    dex_sender1 = transfer.data['sender']
-                    dex_sender1_jetton_wallet = transfer.data['sender_wallet']
+                    asset1 = transfer.data.asset
+                    wallet1 = transfer.data.receiver_wallet
+                    dex_sender1 = transfer.data.sender
+                    dex_sender1_jetton_wallet = transfer.data.sender_wallet
                 else:
                     amount2 = amount
-                    asset2 = transfer.data['asset']
-                    wallet2 = transfer.data['receiver_wallet']
-                    dex_sender2 = transfer.data['sender']
-                    dex_sender2_jetton_wallet = transfer.data['sender_wallet']
+                    asset2 = transfer.data.asset
+                    wallet2 = transfer.data.receiver_wallet
+                    dex_sender2 = transfer.data.sender
+                    dex_sender2_jetton_wallet = transfer.data.sender_wallet
         sender = None
         sender_wallet = None
         asset = None
@@ -656,10 +656,10 @@ class StonfiV2WithdrawLiquidityMatcher(BlockMatcher):
                 if b.label == 'withdraw_liquidity':
                     burn = b.block.previous_block
                     if isinstance(burn, JettonBurnBlock):
-                        sender = burn.data['owner']
-                        sender_wallet = burn.data['jetton_wallet']
-                        burned_lps = burn.data['amount']
-                        asset = burn.data['asset']
+                        sender = burn.data.owner
+                        sender_wallet = burn.data.jetton_wallet
+                        burned_lps = burn.data.amount
+                        asset = burn.data.asset
                     else:
                         return []
         new_block = Block('dex_withdraw_liquidity', [])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+from dataclasses import dataclass
 
 from pytoniq_core import Slice
 
@@ -15,12 +16,39 @@ from indexer.events.blocks.utils.block_utils import find_call_contracts
 from indexer.events.blocks.utils.block_utils import find_messages
 
 
+@dataclass
+class NftMintData:
+    source: AccountId | None
+    address: AccountId
+    index: int
+    opcode: int | None
+    collection: AccountId | None
+
+
 class NftMintBlock(Block):
-    def __init__(self, data: dict):
+    data: NftMintData
+
+    def __init__(self, data: NftMintData):
         super().__init__('nft_mint', [], data)
 
 
+@dataclass
+class NftTransferData:
+    prev_owner: AccountId | None
+    new_owner: AccountId
+    query_id: int
+    forward_amount: Amount | None
+    response_destination: AccountId | None
+    custom_payload: str | None
+    forward_payload: str | None
+    nft: dict
+    is_purchase: bool = False
+    price: Amount | None = None
+
+
 class NftTransferBlock(Block):
+    data: NftTransferData
+
     def __init__(self):
         super().__init__('nft_transfer', [],  None)
 
@@ -77,41 +105,43 @@ class NftTransferBlockMatcher(BlockMatcher):
     async def build_block(self, block: Block, other_blocks: list['Block']):
         new_block = NftTransferBlock()
         include = [block]
-        data = dict()
-        data['is_purchase'] = False
         nft_transfer_message = NftTransfer(
             Slice.one_from_boc(block.event_nodes[0].message.message_content.body))
         ownership_assigned_message = find_messages(other_blocks, NftOwnershipAssigned)
         if len(ownership_assigned_message) > 0:
             nft_ownership_message = ownership_assigned_message[0][1]
-            data['prev_owner'] = AccountId(nft_ownership_message.prev_owner)
+            prev_owner = AccountId(nft_ownership_message.prev_owner)
         else:
-            data['prev_owner'] = AccountId(block.event_nodes[0].message.source)
-        data['query_id'] = nft_transfer_message.query_id
-        data['forward_amount'] = Amount(nft_transfer_message.forward_amount)
+            prev_owner = AccountId(block.event_nodes[0].message.source)
         if nft_transfer_message.response_destination:
-            data['response_destination'] = AccountId(nft_transfer_message.response_destination)
+            response_destination = AccountId(nft_transfer_message.response_destination)
         else:
-            data['response_destination'] = None
-        data['custom_payload'] = base64.b64encode(nft_transfer_message.custom_payload).decode('utf-8') if (
-                nft_transfer_message.custom_payload is not None) else None
-        data['forward_payload'] = base64.b64encode(nft_transfer_message.forward_payload).decode('utf-8') if (
-                nft_transfer_message.forward_payload is not None) else None
-        data['new_owner'] = AccountId(nft_transfer_message.new_owner)
-        data['nft'] = await _get_nft_data(AccountId(block.event_nodes[0].message.transaction.account))
+            response_destination = None
+        data = NftTransferData(
+            prev_owner=prev_owner,
+            new_owner=AccountId(nft_transfer_message.new_owner),
+            query_id=nft_transfer_message.query_id,
+            forward_amount=Amount(nft_transfer_message.forward_amount),
+            response_destination=response_destination,
+            custom_payload=base64.b64encode(nft_transfer_message.custom_payload).decode('utf-8') if (
+                    nft_transfer_message.custom_payload is not None) else None,
+            forward_payload=base64.b64encode(nft_transfer_message.forward_payload).decode('utf-8') if (
+                    nft_transfer_message.forward_payload is not None) else None,
+            nft=await _get_nft_data(AccountId(block.event_nodes[0].message.transaction.account)),
+        )
         if block.previous_block is not None and isinstance(block.previous_block, TonTransferBlock):
             nft_purchase_data = await _try_get_nft_purchase_data(block, nft_transfer_message.new_owner.to_str(False))
             if nft_purchase_data is not None:
                 block_to_include, price = nft_purchase_data
-                data['is_purchase'] = True
-                data['price'] = Amount(price)
+                data.is_purchase = True
+                data.price = Amount(price)
                 if isinstance(block.previous_block, TonTransferBlock):
                     include.append(block.previous_block)
 
         include.extend(other_blocks)
         new_block.merge_blocks(include)
         new_block.data = data
-        if not data['nft']['exists']:
+        if not data.nft['exists']:
             new_block.broken = True
         new_block.failed = block.failed
         return [new_block]
@@ -130,24 +160,24 @@ class TelegramNftPurchaseBlockMatcher(BlockMatcher):
         assert isinstance(block, CallContractBlock)
         new_block = NftTransferBlock()
         include = [block]
-        data = dict()
-        data['is_purchase'] = False
         message = block.get_message()
         nft_ownership_message = NftOwnershipAssigned(Slice.one_from_boc(message.message_content.body))
-        data['new_owner'] = AccountId(message.destination)
-        data['prev_owner'] = AccountId(nft_ownership_message.prev_owner) if nft_ownership_message.prev_owner is not None else None
-        data['query_id'] = nft_ownership_message.query_id
-        data['forward_amount'] = None
-        data['response_destination'] = None
-        data['custom_payload'] = None
-        data['forward_payload'] = None
-        data['nft'] = await _get_nft_data(AccountId(block.get_message().source))
+        data = NftTransferData(
+            prev_owner=AccountId(nft_ownership_message.prev_owner) if nft_ownership_message.prev_owner is not None else None,
+            new_owner=AccountId(message.destination),
+            query_id=nft_ownership_message.query_id,
+            forward_amount=None,
+            response_destination=None,
+            custom_payload=None,
+            forward_payload=None,
+            nft=await _get_nft_data(AccountId(block.get_message().source)),
+        )
         payload = nft_ownership_message.nft_payload
         if payload is not None:
-            data['forward_payload'] = base64.b64encode(payload.raw).decode('utf-8')
+            data.forward_payload = base64.b64encode(payload.raw).decode('utf-8')
         if payload is not None and isinstance(payload.value, TeleitemBidInfo):
-            data['is_purchase'] = True
-            data['price'] = Amount(payload.value.bid)
+            data.is_purchase = True
+            data.price = Amount(payload.value.bid)
             prev_block = block.previous_block
             if (isinstance(prev_block, TonTransferBlock) or
                     (isinstance(prev_block, CallContractBlock) and prev_block.get_message().source is None)):
@@ -157,7 +187,7 @@ class TelegramNftPurchaseBlockMatcher(BlockMatcher):
         include.extend(other_blocks)
         new_block.merge_blocks(include)
         new_block.data = data
-        if not data['nft']['exists']:
+        if not data.nft['exists']:
             new_block.broken = True
         return [new_block]
 
@@ -176,13 +206,13 @@ class NftMintBlockMatcher(BlockMatcher):
         if nft_item is None:
             return []
         source = block.event_nodes[0].message.source
-        data = {
-            "source": AccountId(source) if source else None,
-            "address": AccountId(address),
-            "index": nft_item.index,
-            "opcode": block.event_nodes[0].get_opcode(),
-            "collection": AccountId(nft_item.collection_address) if nft_item.collection_address else None,
-        }
+        data = NftMintData(
+            source=AccountId(source) if source else None,
+            address=AccountId(address),
+            index=nft_item.index,
+            opcode=block.event_nodes[0].get_opcode(),
+            collection=AccountId(nft_item.collection_address) if nft_item.collection_address else None,
+        )
         new_block = NftMintBlock(data)
         new_block.merge_blocks([block])
         return [new_block]
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from indexer.events.blocks.basic_blocks import CallContractBlock
 from indexer.events.blocks.basic_matchers import BlockMatcher, ContractMatcher
 from indexer.events.blocks.core import Block
@@ -9,16 +11,35 @@ from indexer.events.blocks.utils import AccountId, Amount
 from indexer.events.blocks.utils.block_utils import find_call_contract
 
 
+@dataclass
+class SubscriptionData:
+    subscriber: AccountId
+    subscription: AccountId
+    beneficiary: AccountId | None
+    amount: Amount
+
+
 class SubscriptionBlock(Block):
-    def __init__(self, data):
+    data: SubscriptionData
+
+    def __init__(self, data: SubscriptionData | None):
         super().__init__('subscribe', [], data)
 
     def __repr__(self):
         return f"SUBSCRIPTION {self.event_nodes[0].message.transaction.hash}"
 
 
+@dataclass
+class UnsubscribeData:
+    subscriber: AccountId
+    subscription: AccountId
+    beneficiary: AccountId | None
+
+
 class UnsubscribeBlock(Block):
-    def __init__(self, data):
+    data: UnsubscribeData
+
+    def __init__(self, data: UnsubscribeData | None):
         super().__init__('unsubscribe', [], data)
 
     def __repr__(self):
@@ -34,7 +55,7 @@ class SubscriptionBlockMatcher(BlockMatcher):
         return isinstance(block, CallContractBlock) and block.opcode == SubscriptionPaymentRequestResponse.opcode
 
     async def build_block(self, block: Block | CallContractBlock, other_blocks: list[Block]) -> list[Block]:
-        new_block = SubscriptionBlock({})
+        new_block = SubscriptionBlock(None)
         subscriber = AccountId(block.get_message().source)
         subscription = AccountId(block.get_message().destination)
         amount = Amount(block.get_message().value)
@@ -47,12 +68,12 @@ class SubscriptionBlockMatcher(BlockMatcher):
             payment_request_data = SubscriptionPaymentRequest(payment_request.get_body())
             amount = Amount(payment_request_data.grams)
             failed = payment_request.failed
-        new_block.data = {
-            'subscriber': subscriber,
-            'subscription': subscription,
-            'beneficiary': beneficiary,
-            'amount': amount
-        }
+        new_block.data = SubscriptionData(
+            subscriber=subscriber,
+            subscription=subscription,
+            beneficiary=beneficiary,
+            amount=amount
+        )
         new_block.failed = failed
         new_block.merge_blocks([block] + other_blocks)
         return [new_block]
@@ -66,15 +87,15 @@ class UnsubscribeBlockMatcher(BlockMatcher):
         return isinstance(block, CallContractBlock) and block.opcode == WalletPluginDestruct.opcode
 
     async def build_block(self, block: Block | CallContractBlock, other_blocks: list[Block]) -> list[Block]:
-        new_block = UnsubscribeBlock({})
-        data = {
-            'subscriber': AccountId(block.get_message().source),
-            'subscription': AccountId(block.get_message().destination),
-            'beneficiary': None
-        }
+        new_block = UnsubscribeBlock(None)
+        data = UnsubscribeData(
+            subscriber=AccountId(block.get_message().source),
+            subscription=AccountId(block.get_message().destination),
+            beneficiary=None
+        )
         response = find_call_contract(other_blocks, WalletPluginDestruct.opcode)
         if response is not None:
-            data['beneficiary'] = AccountId(response.get_message().destination)
+            data.beneficiary = AccountId(response.get_message().destination)
         new_block.data = data
         new_block.merge_blocks([block] + other_blocks)
         return [new_block]
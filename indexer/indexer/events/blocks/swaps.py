@@ -93,12 +93,12 @@ async def _get_block_data(block, other_blocks):
     in_jetton = AccountId(dex_in_wallet.jetton) if dex_in_wallet is not None else None
 
     in_source_jetton_wallet = None
-    if in_jetton_transfer.data['has_internal_transfer']:
-        in_source_jetton_wallet = in_jetton_transfer.data['sender_wallet']
+    if in_jetton_transfer.data.has_internal_transfer:
+        in_source_jetton_wallet = in_jetton_transfer.data.sender_wallet
 
     out_destination_jetton_wallet = None
-    if outgoing_jetton_transfer.data['has_internal_transfer']:
-        out_destination_jetton_wallet = outgoing_jetton_transfer.data['receiver_wallet']
+    if outgoing_jetton_transfer.data.has_internal_transfer:
+        out_destination_jetton_wallet = outgoing_jetton_transfer.data.receiver_wallet
 
     incoming_transfer = {
         'asset': Asset(is_ton=in_jetton is None, jetton_address=in_jetton),
@@ -112,14 +112,14 @@ async def _get_block_data(block, other_blocks):
     outgoing_transfer = {
         'asset': Asset(is_ton=actual_out_jetton is None, jetton_address=actual_out_jetton),
         'amount': Amount(out_amt),
-        'source': outgoing_jetton_transfer.data['sender'],
-        'source_jetton_wallet': outgoing_jetton_transfer.data['sender_wallet']
+        'source': outgoing_jetton_transfer.data.sender,
+        'source_jetton_wallet': outgoing_jetton_transfer.data.sender_wallet
     }
     if out_destination_jetton_wallet is not None:
         outgoing_transfer['destination_jetton_wallet'] = out_destination_jetton_wallet
-        outgoing_transfer['destination'] = outgoing_jetton_transfer.data['receiver']
-    elif in_jetton_transfer.data['stonfi_swap_body'] is not None:
-        outgoing_transfer['destination'] = AccountId(in_jetton_transfer.data['stonfi_swap_body']['user_address'])
+        outgoing_transfer['destination'] = outgoing_jetton_transfer.data.receiver
+    elif in_jetton_transfer.data.stonfi_swap_body is not None:
+        outgoing_transfer['destination'] = AccountId(in_jetton_transfer.data.stonfi_swap_body['user_address'])
         outgoing_transfer['destination_jetton_wallet'] = None
     else:
         outgoing_transfer['destination'] = AccountId(swap_message.from_user_address)
@@ -286,19 +286,19 @@ class StonfiV2SwapBlockMatcher(BlockMatcher):
         in_transfer_data = {}
         sender = None
         if isinstance(in_transfer, JettonTransferBlock):
-            sender = in_transfer.data['sender']
-            jetton_address = in_transfer.data['asset'].jetton_address
+            sender = in_transfer.data.sender
+            jetton_address = in_transfer.data.asset.jetton_address
             if jetton_address.as_str() in PTonTransferMatcher.pton_masters:
                 asset = Asset(is_ton=True)
             else:
-                asset = Asset(is_ton=in_transfer.data['asset'].is_ton, jetton_address=jetton_address)
+                asset = Asset(is_ton=in_transfer.data.asset.is_ton, jetton_address=jetton_address)
             in_transfer_data = {
                 'asset': asset,
-                'amount': in_transfer.data['amount'],
-                'source': in_transfer.data['sender'],
-                'source_jetton_wallet': in_transfer.data['sender_wallet'],
-                'destination': in_transfer.data['receiver'],
-                'destination_jetton_wallet': in_transfer.data['receiver_wallet']
+                'amount': in_transfer.data.amount,
+                'source': in_transfer.data.sender,
+                'source_jetton_wallet': in_transfer.data.sender_wallet,
+                'destination': in_transfer.data.receiver,
+                'destination_jetton_wallet': in_transfer.data.receiver_wallet
             }
         else:
             message = in_transfer.event_nodes[0].message
@@ -352,19 +352,19 @@ class StonfiV2SwapBlockMatcher(BlockMatcher):
         additional_blocks_to_include = []
         pton_transfer = next((x for x in out_transfer.next_blocks if isinstance(x, CallContractBlock)
                               and x.opcode == PTonTransfer.opcode), None)
-        if pton_transfer is None and out_transfer.data['has_internal_transfer']:
-            jetton_address = out_transfer.data['asset'].jetton_address
+        if pton_transfer is None and out_transfer.data.has_internal_transfer:
+            jetton_address = out_transfer.data.asset.jetton_address
             if jetton_address.as_str() in PTonTransferMatcher.pton_masters:
                 asset = Asset(is_ton=True)
             else:
-                asset = Asset(is_ton=out_transfer.data['asset'].is_ton, jetton_address=jetton_address)
+                asset = Asset(is_ton=out_transfer.data.asset.is_ton, jetton_address=jetton_address)
             out_transfer_data = {
                 'asset': asset,
-                'amount': out_transfer.data['amount'],
-                'source': out_transfer.data['sender'],
-                'source_jetton_wallet': out_transfer.data['sender_wallet'],
-                'destination': out_transfer.data['receiver'],
-                'destination_jetton_wallet': out_transfer.data['receiver_wallet']
+                'amount': out_transfer.data.amount,
+                'source': out_transfer.data.sender,
+                'source_jetton_wallet': out_transfer.data.sender_wallet,
+                'destination': out_transfer.data.receiver,
+                'destination_jetton_wallet': out_transfer.data.receiver_wallet
             }
         else:
             additional_blocks_to_include.append(pton_transfer)
@@ -372,8 +372,8 @@ class StonfiV2SwapBlockMatcher(BlockMatcher):
             out_transfer_data = {
                 'asset': Asset(is_ton=True, jetton_address=None),
                 'amount': Amount(amount),
-                'source': out_transfer.data['sender'],
-                'source_jetton_wallet': out_transfer.data['sender_wallet'],
+                'source': out_transfer.data.sender,
+                'source_jetton_wallet': out_transfer.data.sender_wallet,
                 'destination': AccountId(pton_transfer.get_message().destination),
                 'destination_jetton_wallet': None,
             }
@@ -507,15 +507,15 @@ class DedustSwapBlockMatcher(BlockMatcher):
         asset_in = None
         swap_steps_slice = None
         if sender_jetton_transfer_block is not None:
-            dex_incoming_jetton_wallet = sender_jetton_transfer_block.data['receiver_wallet']
-            dex_incoming_wallet = sender_jetton_transfer_block.data['receiver']
-            sender_wallet = sender_jetton_transfer_block.data['sender_wallet']
-            sender = sender_jetton_transfer_block.data['sender']
-            asset_in = sender_jetton_transfer_block.data['asset']
-            if int(sender_jetton_transfer_block.data['payload_opcode'], 0) != DedustSwapPayload.opcode:
+            dex_incoming_jetton_wallet = sender_jetton_transfer_block.data.receiver_wallet
+            dex_incoming_wallet = sender_jetton_transfer_block.data.receiver
+            sender_wallet = sender_jetton_transfer_block.data.sender_wallet
+            sender = sender_jetton_transfer_block.data.sender
+            asset_in = sender_jetton_transfer_block.data.asset
+            if int(sender_jetton_transfer_block.data.payload_opcode, 0) != DedustSwapPayload.opcode:
                 return []
-            amount_in = sender_jetton_transfer_block.data['amount']
-            swap_steps_slice = Slice.one_from_boc(sender_jetton_transfer_block.data['forward_payload'])
+            amount_in = sender_jetton_transfer_block.data.amount
+            swap_steps_slice = Slice.one_from_boc(sender_jetton_transfer_block.data.forward_payload)
             swap_steps_slice.skip_bits(32) # sum type
         else:
             swap_requests = find_call_contracts(other_blocks, DedustSwap.opcode)
@@ -541,12 +541,12 @@ class DedustSwapBlockMatcher(BlockMatcher):
             if payout_block in include:
                 if isinstance(payout_block, JettonTransferBlock):
                     payout = payout_block
-                    receiver_wallet = payout.data['receiver_wallet']
-                    receiver = payout.data['receiver']
-                    dex_outgoing_wallet = payout.data['sender']
-                    dex_outgoing_jetton_wallet = payout.data['sender_wallet']
-                    actual_asset_out = payout.data['asset']
-                    actual_amount_out = payout.data['amount']
+                    receiver_wallet = payout.data.receiver_wallet
+                    receiver = payout.data.receiver
+                    dex_outgoing_wallet = payout.data.sender
+                    dex_outgoing_jetton_wallet = payout.data.sender_wallet
+                    actual_asset_out = payout.data.asset
+                    actual_amount_out = payout.data.amount
                 elif isinstance(payout_block, CallContractBlock) and payout_block.opcode == DedustPayout.opcode:
                     payout = payout_block
                     dex_outgoing_wallet = AccountId(payout.get_message().source)
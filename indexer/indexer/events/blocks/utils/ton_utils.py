@@ -64,6 +64,7 @@ class AccountId:
                 self.address = Address(address)
         else:
             self.address = address
+        self._str_cache = None
 
     def __repr__(self):
         return self.address.to_str(False) if self.address else "addr_none"
@@ -89,7 +90,10 @@ class AccountId:
     def as_str(self):
         if self.address is None:
             return None
-        return self.address.to_str(False).upper()
+        # Raw form is requested many times per action, encode it only once
+        if self._str_cache is None:
+            self._str_cache = self.address.to_str(False).upper()
+        return self._str_cache
 
     def to_json(self):
         return self.as_str()